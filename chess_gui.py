@@ -1,6 +1,5 @@
 import tkinter as tk
-from tkinter import messagebox
-from typing import Optional
+from typing import Iterable, Optional
 from chess_logic import AtomicChessGame
 
 # Constants for styling
@@ -9,17 +8,55 @@ BG_COLOR = "#2b2b2b"
 LIGHT_SQUARE_COLOR = "#f0d9b5"
 DARK_SQUARE_COLOR = "#b58863"
 HIGHLIGHT_COLOR = "#ffffff"
+STATUS_COLOR = "#ffcc66"
 TITLE_FONT = ("Arial", 30, "bold")
 LABEL_FONT = ("Arial", 12, "bold")
 BUTTON_FONT = ("Arial", 12, "bold")
 PIECE_FONT = ("Arial", 16)
+STATUS_FONT = ("Arial", 11)
+
+# How long a status message stays visible
+STATUS_DURATION_MS = 1500
 
 # Constants for board dimensions
 BOARD_SIZE = 8
-SQUARE_WIDTH = 6
-SQUARE_HEIGHT = 3
+SQUARE_SIZE = 80  # pixels
 EMPTY_SQUARE = 0
 
+# chess notation of every square, indexed row * BOARD_SIZE + col
+SQUARE_NAMES = tuple(
+    letter + str(BOARD_SIZE - row) for row in range(BOARD_SIZE) for letter in "abcdefgh"
+)
+
+# base color of every square, indexed row * BOARD_SIZE + col
+SQUARE_COLORS = tuple(
+    LIGHT_SQUARE_COLOR if (row + col) % 2 == 0 else DARK_SQUARE_COLOR
+    for row in range(BOARD_SIZE)
+    for col in range(BOARD_SIZE)
+)
+
+# use unicode symbols for pieces
+# 1-6: black pieces, 10-60: white pieces
+PIECE_SYMBOLS = {
+    EMPTY_SQUARE: "",
+    1: "♜",
+    2: "♞",
+    3: "♝",
+    4: "♛",
+    5: "♚",
+    6: "♟",
+    10: "♖",
+    20: "♘",
+    30: "♗",
+    40: "♕",
+    50: "♔",
+    60: "♙",
+}
+# tuple indexed directly by piece value, for fast lookups when redrawing
+SYMBOL_TABLE = tuple(
+    PIECE_SYMBOLS.get(piece, "") for piece in range(max(PIECE_SYMBOLS) + 1)
+)
+
 # Game state constants
 GAME_UNFINISHED = "UNFINISHED"
 
@@ -33,27 +70,27 @@ class ChessGUI:
         self.root.geometry(WINDOW_SIZE)
         self.root.configure(bg=BG_COLOR)
 
+        # shared font objects, so Tk parses each font description only once
+        from tkinter import font
+
+        self.title_font = font.Font(root=self.root, font=TITLE_FONT)
+        self.label_font = font.Font(root=self.root, font=LABEL_FONT)
+        self.status_font = font.Font(root=self.root, font=STATUS_FONT)
+        self.piece_font = font.Font(root=self.root, font=PIECE_FONT)
+        self.button_font = font.Font(root=self.root, font=BUTTON_FONT)
+
         self.game = AtomicChessGame()
         self.selected_square: Optional[tuple[int, int]] = None
-        self.board_buttons: list[list[tk.Button]] = []
-
-        # use unicode symbols for pieces
-        # 1-6: black pieces, 10-60: white pieces
-        self.piece_symbols = {
-            EMPTY_SQUARE: "",
-            1: "♜",
-            2: "♞",
-            3: "♝",
-            4: "♛",
-            5: "♚",
-            6: "♟",
-            10: "♖",
-            20: "♘",
-            30: "♗",
-            40: "♕",
-            50: "♔",
-            60: "♙",
-        }
+        # canvas item ids of every square and piece, indexed row * 8 + col
+        self.square_ids: list[int] = []
+        self.piece_ids: list[int] = []
+        # symbol currently shown on every square, so unchanged ones are skipped
+        self.drawn_symbols: list[Optional[str]] = []
+        # pending Tk callback that clears the status message, if any
+        self.status_clear_id: Optional[str] = None
+        # squares waiting for the next idle-time redraw, batched per event
+        self.dirty_squares: list[tuple[int, int]] = []
+        self.redraw_pending = False
 
         self._setup_ui()
         self._update_board()
@@ -62,6 +99,7 @@ class ChessGUI:
         """Set up the main UI components: title, game info, chess board, and control buttons."""
         self._create_title()
         self._create_game_info_bar()
+        self._create_status_label()
         self._create_chess_board()
         self._create_control_buttons()
 
@@ -70,7 +108,7 @@ class ChessGUI:
         title_label = tk.Label(
             self.root,
             text="Atomic Chess",
-            font=TITLE_FONT,
+            font=self.title_font,
             bg=BG_COLOR,
             fg="white",
         )
@@ -84,7 +122,7 @@ class ChessGUI:
         self.game_state_label = tk.Label(
             info_bar,
             text="Game State: UNFINISHED",
-            font=LABEL_FONT,
+            font=self.label_font,
             bg=BG_COLOR,
             fg="white",
         )
@@ -93,12 +131,23 @@ class ChessGUI:
         self.current_player_label = tk.Label(
             info_bar,
             text="Current Player: WHITE",
-            font=LABEL_FONT,
+            font=self.label_font,
             bg=BG_COLOR,
             fg="white",
         )
         self.current_player_label.pack(side=tk.LEFT, padx=20)
 
+    def _create_status_label(self) -> None:
+        """Create the label that shows short messages such as invalid moves."""
+        self.status_label = tk.Label(
+            self.root,
+            text="",
+            font=self.status_font,
+            bg=BG_COLOR,
+            fg=STATUS_COLOR,
+        )
+        self.status_label.pack()
+
     def _create_chess_board(self) -> None:
         """Create the chess board with labels and squares."""
         board_frame = tk.Frame(self.root, bg=BG_COLOR)
@@ -117,26 +166,33 @@ class ChessGUI:
             label = tk.Label(
                 column_frame,
                 text=letter,
-                font=LABEL_FONT,
+                font=self.label_font,
                 bg=BG_COLOR,
                 fg="white",
-                width=BOARD_SIZE,
                 height=2,
             )
             label.grid(row=0, column=i)
+            column_frame.grid_columnconfigure(i, minsize=SQUARE_SIZE)
 
     def _create_board_grid(self, board_frame: tk.Frame) -> None:
-        """Create the main board frame for chess squares."""
-        self.board_frame = tk.Frame(board_frame, bg=BG_COLOR)
-        self.board_frame.grid(row=1, column=1)
+        """Create the canvas the chess squares are drawn on."""
+        self.board_canvas = tk.Canvas(
+            board_frame,
+            width=BOARD_SIZE * SQUARE_SIZE,
+            height=BOARD_SIZE * SQUARE_SIZE,
+            bg=BG_COLOR,
+            highlightthickness=0,
+        )
+        self.board_canvas.grid(row=1, column=1)
+        self.board_canvas.bind("<Button-1>", self._board_clicked)
 
     def _create_row_labels_and_squares(self, board_frame: tk.Frame) -> None:
         """Create row labels and chess board squares."""
         # Create frames for row labels
         left_row_frame = tk.Frame(board_frame, bg=BG_COLOR)
-        left_row_frame.grid(row=0, column=0, rowspan=2)
+        left_row_frame.grid(row=1, column=0)
         right_row_frame = tk.Frame(board_frame, bg=BG_COLOR)
-        right_row_frame.grid(row=0, column=9, rowspan=2)
+        right_row_frame.grid(row=1, column=9)
 
         for row in range(BOARD_SIZE):
             self._create_row_label(left_row_frame, row)
@@ -148,30 +204,36 @@ class ChessGUI:
         row_label = tk.Label(
             parent_frame,
             text=str(BOARD_SIZE - row),
-            font=LABEL_FONT,
+            font=self.label_font,
             bg=BG_COLOR,
             fg="white",
             width=2,
         )
-        row_label.grid(row=row + 1, column=0, sticky="w", pady=(35))
+        row_label.grid(row=row, column=0, sticky="w")
+        parent_frame.grid_rowconfigure(row, minsize=SQUARE_SIZE)
 
     def _create_board_row(self, row: int) -> None:
-        """Create a single row of chess board squares."""
-        button_row = []
+        """Draw a single row of chess board squares and their (empty) pieces."""
+        top = row * SQUARE_SIZE
         for col in range(BOARD_SIZE):
-            is_light = (row + col) % 2 == 0
-            color = LIGHT_SQUARE_COLOR if is_light else DARK_SQUARE_COLOR
-            button = tk.Button(
-                self.board_frame,
-                width=SQUARE_WIDTH,
-                height=SQUARE_HEIGHT,
-                bg=color,
-                font=PIECE_FONT,
-                command=lambda r=row, c=col: self._square_clicked(r, c),
+            left = col * SQUARE_SIZE
+            square_id = self.board_canvas.create_rectangle(
+                left,
+                top,
+                left + SQUARE_SIZE,
+                top + SQUARE_SIZE,
+                fill=SQUARE_COLORS[row * BOARD_SIZE + col],
+                outline=BG_COLOR,
             )
-            button.grid(row=row, column=col, padx=1, pady=1)
-            button_row.append(button)
-        self.board_buttons.append(button_row)
+            piece_id = self.board_canvas.create_text(
+                left + SQUARE_SIZE // 2,
+                top + SQUARE_SIZE // 2,
+                text="",
+                font=self.piece_font,
+            )
+            self.square_ids.append(square_id)
+            self.piece_ids.append(piece_id)
+            self.drawn_symbols.append("")
 
     def _create_bottom_column_labels(self, board_frame: tk.Frame) -> None:
         """Create the bottom column labels (a-h)."""
@@ -181,12 +243,12 @@ class ChessGUI:
             label = tk.Label(
                 bottom_column_frame,
                 text=letter,
-                font=LABEL_FONT,
+                font=self.label_font,
                 bg=BG_COLOR,
                 fg="white",
-                width=BOARD_SIZE,
             )
             label.grid(row=0, column=i)
+            bottom_column_frame.grid_columnconfigure(i, minsize=SQUARE_SIZE)
 
     def _create_control_buttons(self) -> None:
         """Create the control buttons (New Game, Quit)."""
@@ -196,7 +258,7 @@ class ChessGUI:
         reset_button = tk.Button(
             button_frame,
             text="New Game",
-            font=BUTTON_FONT,
+            font=self.button_font,
             command=self.new_game,
             bg="#4CAF50",
             fg="white",
@@ -207,7 +269,7 @@ class ChessGUI:
         quit_button = tk.Button(
             button_frame,
             text="Quit",
-            font=BUTTON_FONT,
+            font=self.button_font,
             command=self.root.quit,
             bg="#f44336",
             fg="white",
@@ -215,25 +277,28 @@ class ChessGUI:
         )
         quit_button.pack(side=tk.LEFT, padx=20)
 
+    def _board_clicked(self, event: tk.Event) -> None:
+        """Handle a click on the board canvas by finding the square under it."""
+        row = event.y // SQUARE_SIZE
+        col = event.x // SQUARE_SIZE
+        if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
+            self._square_clicked(row, col)
+
     def _square_clicked(self, row: int, col: int) -> None:
         """Handle click events on chess squares."""
         if self.game.get_game_state() != GAME_UNFINISHED:
-            messagebox.showinfo(
-                "Game Over", f"Game is finished! Winner: {self.game.get_game_state()}"
+            self._show_game_over(
+                f"Game is finished! Winner: {self.game.get_game_state()}"
             )
             return
 
         if self.selected_square is None:
             piece = self.game.get_piece_type(row, col)
             if piece == EMPTY_SQUARE:
-                messagebox.showwarning(
-                    "Invalid Selection", "Please select a piece to move."
-                )
+                self._show_status("Please select a piece to move.")
                 return
             if not self.game._check_if_valid_player(piece):
-                messagebox.showwarning(
-                    "Invalid Selection", "Please select one of your own pieces."
-                )
+                self._show_status("Please select one of your own pieces.")
                 return
             self.selected_square = (row, col)
             self._highlight_selected_square(row, col)
@@ -243,45 +308,88 @@ class ChessGUI:
                 self._clear_selection()
                 return
             # convert coordinates to chess notation
-            start_pos = chr(ord("a") + start_col) + str(BOARD_SIZE - start_row)
-            end_pos = chr(ord("a") + col) + str(BOARD_SIZE - row)
+            start_pos = SQUARE_NAMES[start_row * BOARD_SIZE + start_col]
+            end_pos = SQUARE_NAMES[row * BOARD_SIZE + col]
             if self.game.make_move(start_pos, end_pos):
                 self._clear_selection()
-                self._update_board()
-                self._update_game_info()
+                self._schedule_redraw(self.game.get_changed_squares())
                 if self.game.get_game_state() != GAME_UNFINISHED:
-                    messagebox.showinfo(
-                        "Game Over", f"Winner: {self.game.get_game_state()}!"
-                    )
+                    # run the queued redraw and paint it before the modal
+                    # dialog opens, whatever the platform's dialog does
+                    self.root.update_idletasks()
+                    self._show_game_over(f"Winner: {self.game.get_game_state()}!")
             else:
-                messagebox.showwarning("Invalid Move", "That move is not allowed.")
+                self._show_status("That move is not allowed.")
                 self._clear_selection()
 
+    def _show_game_over(self, message: str) -> None:
+        """Show the game over message box."""
+        # messagebox is only needed once a game ends, so import it on first use
+        from tkinter import messagebox
+
+        messagebox.showinfo("Game Over", message)
+
+    def _show_status(self, message: str) -> None:
+        """Show a message in the status label for STATUS_DURATION_MS, without
+        blocking the event loop the way a message box does."""
+        if self.status_clear_id is not None:
+            self.root.after_cancel(self.status_clear_id)
+        self.status_label.configure(text=message)
+        self.status_clear_id = self.root.after(STATUS_DURATION_MS, self._clear_status)
+
+    def _clear_status(self) -> None:
+        """Clear the status label."""
+        self.status_clear_id = None
+        self.status_label.configure(text="")
+
     def _highlight_selected_square(self, row: int, col: int) -> None:
         """Highlight the selected square."""
-        self.board_buttons[row][col].configure(bg=HIGHLIGHT_COLOR)
+        self.board_canvas.itemconfigure(
+            self.square_ids[row * BOARD_SIZE + col], fill=HIGHLIGHT_COLOR
+        )
 
     def _clear_selection(self) -> None:
-        """Clear the current selection and reset square colors."""
+        """Clear the current selection and restore the highlighted square's color."""
+        if self.selected_square is not None:
+            row, col = self.selected_square
+            index = row * BOARD_SIZE + col
+            self.board_canvas.itemconfigure(
+                self.square_ids[index], fill=SQUARE_COLORS[index]
+            )
         self.selected_square = None
-        self._update_board_colors()
-
-    def _update_board_colors(self) -> None:
-        """Update the colors of all board squares."""
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                is_light = (row + col) % 2 == 0
-                color = LIGHT_SQUARE_COLOR if is_light else DARK_SQUARE_COLOR
-                self.board_buttons[row][col].configure(bg=color)
 
     def _update_board(self) -> None:
-        """Update the visual representation of the board."""
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                piece = self.game.get_piece_type(row, col)
-                symbol = self.piece_symbols.get(piece, "")
-                self.board_buttons[row][col].configure(text=symbol)
-        self._update_board_colors()
+        """Update the visual representation of the whole board."""
+        self._update_squares(
+            (row, col) for row in range(BOARD_SIZE) for col in range(BOARD_SIZE)
+        )
+
+    def _update_squares(self, squares: Iterable[tuple[int, int]]) -> None:
+        """Update the pieces shown on the given (row, col) squares only."""
+        board = self.game.get_board()
+        piece_ids = self.piece_ids
+        drawn_symbols = self.drawn_symbols
+        itemconfigure = self.board_canvas.itemconfigure
+        for row, col in squares:
+            index = row * BOARD_SIZE + col
+            symbol = SYMBOL_TABLE[board[index]]
+            if symbol != drawn_symbols[index]:
+                itemconfigure(piece_ids[index], text=symbol)
+                drawn_symbols[index] = symbol
+
+    def _schedule_redraw(self, squares: Iterable[tuple[int, int]]) -> None:
+        """Queue squares for a single redraw once Tk is idle."""
+        self.dirty_squares.extend(squares)
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.root.after_idle(self._redraw)
+
+    def _redraw(self) -> None:
+        """Redraw the queued squares and the game info labels."""
+        self.redraw_pending = False
+        squares, self.dirty_squares = self.dirty_squares, []
+        self._update_squares(squares)
+        self._update_game_info()
 
     def _update_game_info(self) -> None:
         """Update the game state and current player labels."""
@@ -295,7 +403,7 @@ class ChessGUI:
     def new_game(self) -> None:
         """Start a new game."""
         self.game = AtomicChessGame()
-        self.selected_square = None
+        self._clear_selection()
         self._update_board()
         self._update_game_info()
 
@@ -305,10 +413,23 @@ class ChessGUI:
 
     # for development: reload the UI without restarting the app
     def reload_ui(self) -> None:
-        """Reload the UI by destroying and recreating all widgets."""
+        """Reload the UI by redrawing every square and label on the existing widgets."""
+        self._clear_selection()
+        self.drawn_symbols = [None] * len(self.piece_ids)
+        self._update_board()
+        self._update_game_info()
+
+    def _rebuild_layout(self) -> None:
+        """Destroy and recreate all widgets, for when the layout itself changes."""
         for widget in self.root.winfo_children():
             widget.destroy()
-        self.board_buttons.clear()
+        self.square_ids.clear()
+        self.piece_ids.clear()
+        self.drawn_symbols.clear()
+        self.selected_square = None
+        if self.status_clear_id is not None:
+            self.root.after_cancel(self.status_clear_id)
+            self.status_clear_id = None
         self._setup_ui()
         self._update_board()
         self._update_game_info()
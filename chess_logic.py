@@ -1,5 +1,4 @@
-from enum import Enum
-from typing import List
+from typing import List, Tuple
 
 # Piece constants
 __ = 0  # empty space
@@ -33,10 +32,69 @@ GAME_BLACK_WON = "BLACK_WON"
 PLAYER_WHITE = "WHITE"
 PLAYER_BLACK = "BLACK"
 
+# Sides, stored as ints so turn checks avoid string comparisons
+WHITE_SIDE = 0
+BLACK_SIDE = 1
+PLAYER_NAMES = (PLAYER_WHITE, PLAYER_BLACK)  # indexed by side
+NO_SIDE = -1  # side of an empty square or a non-piece value
+
+# every piece value of each color
+BLACK_PIECES = (BR, BH, BB, BQ, BK, BP)
+WHITE_PIECES = (WR, WH, WB, WQ, WK, WP)
+
+# side owning each piece, indexed by piece value
+PIECE_COLOR = tuple(
+    (
+        BLACK_SIDE
+        if piece in BLACK_PIECES
+        else WHITE_SIDE if piece in WHITE_PIECES else NO_SIDE
+    )
+    for piece in range(WP + 1)
+)
+
+# (row, column) of every square in algebraic notation, with either letter
+# case for the file
+SQUARE_TABLE = {
+    file + str(BOARD_SIZE - row): (row, column)
+    for row in range(BOARD_SIZE)
+    for column, files in enumerate(zip("abcdefgh", "ABCDEFGH"))
+    for file in files
+}
+
 # Board positions for pawn starting rows
 BLACK_PAWN_START_ROW = 1
 WHITE_PAWN_START_ROW = 6
 
+# row step of a pawn moving one square forward, and its starting row
+PAWN_DIRECTION = {BP: 1, WP: -1}
+PAWN_START_ROW = {BP: BLACK_PAWN_START_ROW, WP: WHITE_PAWN_START_ROW}
+
+# (row, column) offsets of the 8 squares surrounding an explosion
+EXPLOSION_OFFSETS = (
+    (-1, -1),  # top-left
+    (-1, 0),  # top
+    (-1, 1),  # top-right
+    (0, -1),  # left
+    (0, 1),  # right
+    (1, -1),  # bottom-left
+    (1, 0),  # bottom
+    (1, 1),  # bottom-right
+)
+# offsets of every square caught in an explosion, including its center
+EXPLOSION_AREA_OFFSETS = ((0, 0),) + EXPLOSION_OFFSETS
+
+# (row, column) offsets of the 8 squares a knight can jump to
+KNIGHT_OFFSETS = (
+    (-2, -1),
+    (-2, 1),
+    (-1, -2),
+    (-1, 2),
+    (1, -2),
+    (1, 2),
+    (2, -1),
+    (2, 1),
+)
+
 # Piece value mappings
 PIECE_W_PAWN = WP
 PIECE_W_ROOK = WR
@@ -51,23 +109,118 @@ PIECE_B_BISHOP = BB
 PIECE_B_QUEEN = BQ
 PIECE_B_KING = BK
 
+# King mask covering both colors: bit p is set for each king value p, so
+# (1 << piece) & KINGS_MASK tests for a king of either color in one AND
+KINGS_MASK = (1 << BK) | (1 << WK)
 
-class Piece(Enum):
-    """Enumeration for chess pieces"""
 
-    __ = __  # empty space
-    BR = BR  # black rook
-    BH = BH  # black horse/knight
-    BB = BB  # black bishop
-    BQ = BQ  # black queen
-    BK = BK  # black king
-    BP = BP  # black pawn
-    WR = WR  # white rook
-    WH = WH  # white horse/knight
-    WB = WB  # white bishop
-    WQ = WQ  # white queen
-    WK = WK  # white king
-    WP = WP  # white pawn
+def _squares_between(start_square: int, end_square: int) -> int:
+    """Returns a bitboard of the squares strictly between two squares.
+    Parameters:
+        start_square (int): flat board index of the first square
+        end_square (int): flat board index of the second square
+    Returns:
+        int: bitboard with one bit set per square in between, or 0 if the
+        squares do not share a row, column, or diagonal
+    """
+    start_row, start_column = divmod(start_square, BOARD_SIZE)
+    end_row, end_column = divmod(end_square, BOARD_SIZE)
+    row_distance = abs(end_row - start_row)
+    column_distance = abs(end_column - start_column)
+    if start_square == end_square or (
+        row_distance and column_distance and row_distance != column_distance
+    ):
+        return 0
+
+    # step one square at a time towards the end square
+    step = (
+        ((end_row > start_row) - (end_row < start_row)) * BOARD_SIZE
+        + (end_column > start_column)
+        - (end_column < start_column)
+    )
+    between = 0
+    for square in range(start_square + step, end_square, step):
+        between |= 1 << square
+    return between
+
+
+# BETWEEN[start][end] is the bitboard of squares strictly between two squares
+BETWEEN = tuple(
+    tuple(_squares_between(start, end) for end in range(BOARD_SIZE * BOARD_SIZE))
+    for start in range(BOARD_SIZE * BOARD_SIZE)
+)
+
+
+def _squares_at_offsets(square: int, offsets: Tuple[Tuple[int, int], ...]) -> int:
+    """Returns a bitboard of the on-board squares at the given offsets from a square.
+    Parameters:
+        square (int): flat board index of the square
+        offsets (Tuple[Tuple[int, int], ...]): (row, column) offsets to apply
+    Returns:
+        int: bitboard with one bit set per square that stays on the board
+    """
+    row, column = divmod(square, BOARD_SIZE)
+    squares = 0
+    for row_offset, column_offset in offsets:
+        target_row = row + row_offset
+        target_column = column + column_offset
+        if 0 <= target_row < BOARD_SIZE and 0 <= target_column < BOARD_SIZE:
+            squares |= 1 << (target_row * BOARD_SIZE + target_column)
+    return squares
+
+
+# KNIGHT_MOVES[square] / KING_MOVES[square] are bitboards of the squares a
+# knight / king on square can move to
+KNIGHT_MOVES = tuple(
+    _squares_at_offsets(square, KNIGHT_OFFSETS)
+    for square in range(BOARD_SIZE * BOARD_SIZE)
+)
+KING_MOVES = tuple(
+    _squares_at_offsets(square, EXPLOSION_OFFSETS)
+    for square in range(BOARD_SIZE * BOARD_SIZE)
+)
+# EXPLOSION_MASKS[square] is a bitboard of the squares caught in an explosion
+# on square, including square itself
+EXPLOSION_MASKS = tuple(
+    _squares_at_offsets(square, EXPLOSION_AREA_OFFSETS)
+    for square in range(BOARD_SIZE * BOARD_SIZE)
+)
+
+
+def _squares_on_lines(square: int, diagonal: bool) -> int:
+    """Returns a bitboard of the squares a slider could reach from a square on
+    an empty board.
+    Parameters:
+        square (int): flat board index of the square
+        diagonal (bool): True for the diagonals, False for the row and column
+    Returns:
+        int: bitboard with one bit set per reachable square
+    """
+    row, column = divmod(square, BOARD_SIZE)
+    lines = 0
+    for target in range(BOARD_SIZE * BOARD_SIZE):
+        target_row, target_column = divmod(target, BOARD_SIZE)
+        if diagonal:
+            on_line = abs(target_row - row) == abs(target_column - column)
+        else:
+            on_line = target_row == row or target_column == column
+        if on_line and target != square:
+            lines |= 1 << target
+    return lines
+
+
+# ROOK_LINES[square] / BISHOP_LINES[square] / QUEEN_LINES[square] are bitboards
+# of the squares that piece could reach from square on an empty board
+ROOK_LINES = tuple(
+    _squares_on_lines(square, False) for square in range(BOARD_SIZE * BOARD_SIZE)
+)
+BISHOP_LINES = tuple(
+    _squares_on_lines(square, True) for square in range(BOARD_SIZE * BOARD_SIZE)
+)
+QUEEN_LINES = tuple(
+    rook_lines | bishop_lines
+    for rook_lines, bishop_lines in zip(ROOK_LINES, BISHOP_LINES)
+)
 
 
 class AtomicChessGame:
@@ -82,54 +235,31 @@ class AtomicChessGame:
 
     def __init__(self) -> None:
         """Initialize the chess game with starting positions"""
-        self._board: List[List[int]] = [
-            [BR, BH, BB, BQ, BK, BB, BH, BR],
-            [BP, BP, BP, BP, BP, BP, BP, BP],
-            [
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-            ],
-            [
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-            ],
-            [
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-            ],
-            [
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-                EMPTY_SQUARE,
-            ],
-            [WP, WP, WP, WP, WP, WP, WP, WP],
-            [WR, WH, WB, WQ, WK, WB, WH, WR],
-        ]
+        # board is stored flat, row by row: square (row, column) is at index
+        # row * BOARD_SIZE + column
+        self._board: bytearray = bytearray(
+            [BR, BH, BB, BQ, BK, BB, BH, BR]
+            + [BP] * BOARD_SIZE
+            + [EMPTY_SQUARE] * (BOARD_SIZE * 4)
+            + [WP] * BOARD_SIZE
+            + [WR, WH, WB, WQ, WK, WB, WH, WR]
+        )
+        # bit i of an occupancy bitboard is set iff board square i is occupied
+        # (by a piece of that side, for the per-side bitboards indexed by side)
+        self._occupancy: int = 0
+        self._side_occupancy: List[int] = [0, 0]
+        # bitboard of the squares holding each piece, indexed by piece value, so
+        # finding a piece (e.g. a king) needs no board scan
+        self._piece_bitboards: List[int] = [0] * (WP + 1)
+        for square, piece in enumerate(self._board):
+            if piece != EMPTY_SQUARE:
+                self._occupancy |= 1 << square
+                self._side_occupancy[PIECE_COLOR[piece]] |= 1 << square
+                self._piece_bitboards[piece] |= 1 << square
         self._game_state: str = GAME_UNFINISHED
-        self._current_player: str = PLAYER_WHITE
+        self._side: int = WHITE_SIDE
+        # (row, column) of every square changed by the last move
+        self._changed_squares: List[Tuple[int, int]] = []
 
     def make_move(self, square_moved_from: str, square_moved_to: str) -> bool:
         """
@@ -143,13 +273,18 @@ class AtomicChessGame:
         Returns:
             bool: True if the move was valid and executed, False otherwise
         """
-        # parse square notations to coordinates
-        current_row, current_column = self.parse_square_notation(square_moved_from)
-        destination_row, destination_column = self.parse_square_notation(
-            square_moved_to
-        )
+        # parse square notations to coordinates, rejecting anything that does
+        # not name a square on the board
+        current = SQUARE_TABLE.get(square_moved_from)
+        destination = SQUARE_TABLE.get(square_moved_to)
+        if current is None or destination is None:
+            return False
+        current_row, current_column = current
+        destination_row, destination_column = destination
+        current_square = current_row * BOARD_SIZE + current_column
+        destination_square = destination_row * BOARD_SIZE + destination_column
 
-        piece = self.get_piece_type(current_row, current_column)
+        piece = self._board[current_square]
 
         # validate the move
         if not self.validate_move(
@@ -158,17 +293,19 @@ class AtomicChessGame:
             return False
 
         # execute the move
-        self._board[current_row][current_column] = EMPTY_SQUARE
+        self._changed_squares = [
+            (current_row, current_column),
+            (destination_row, destination_column),
+        ]
+        self._set_square(current_square, EMPTY_SQUARE)
 
         # handle capture with atomic explosion
-        if self._board[destination_row][destination_column] != EMPTY_SQUARE:
-            self._board[destination_row][
-                destination_column
-            ] = EMPTY_SQUARE  # Captured piece explodes
+        if self._board[destination_square] != EMPTY_SQUARE:
+            # Captured piece explodes, clearing the destination square too
             self.execute_atomic_explosion(destination_row, destination_column)
         else:
             # Normal move without capture
-            self._board[destination_row][destination_column] = piece
+            self._set_square(destination_square, piece)
 
         # update game state
         self.check_if_king_dead()
@@ -182,7 +319,17 @@ class AtomicChessGame:
 
     def get_current_player(self) -> str:
         """Returns the current player: WHITE or BLACK"""
-        return self._current_player
+        return PLAYER_NAMES[self._side]
+
+    def get_board(self) -> bytes:
+        """Returns a snapshot of the whole board, one piece value per square,
+        row by row: square (row, column) is at index row * 8 + column"""
+        return bytes(self._board)
+
+    def get_changed_squares(self) -> List[Tuple[int, int]]:
+        """Returns the (row, column) of every square changed by the last move,
+        including squares cleared by an explosion"""
+        return self._changed_squares
 
     def get_piece_type(self, row: int, column: int) -> int:
         """Returns the piece at the given row and column in the chess board.
@@ -192,31 +339,31 @@ class AtomicChessGame:
         Returns:
             int: the piece type at the specified location
         """
-        return self._board[row][column]
+        return self._board[row * BOARD_SIZE + column]
 
     # Private helper methods
 
-    def _valid_piece_for_player(self, piece: int, player: str) -> bool:
-        """Check if a piece belongs to the current player"""
-        if player == PLAYER_WHITE:
-            return piece in [
-                PIECE_W_PAWN,
-                PIECE_W_ROOK,
-                PIECE_W_KNIGHT,
-                PIECE_W_BISHOP,
-                PIECE_W_QUEEN,
-                PIECE_W_KING,
-            ]
-        elif player == PLAYER_BLACK:
-            return piece in [
-                PIECE_B_PAWN,
-                PIECE_B_ROOK,
-                PIECE_B_KNIGHT,
-                PIECE_B_BISHOP,
-                PIECE_B_QUEEN,
-                PIECE_B_KING,
-            ]
-        return False
+    def _set_square(self, square: int, piece: int) -> None:
+        """Puts a piece on a board square, or clears it with EMPTY_SQUARE, and
+        keeps the bitboards in sync.
+        Parameters:
+            square (int): flat board index of the square
+            piece (int): the piece to put on the square, or EMPTY_SQUARE
+        """
+        square_bit = 1 << square
+
+        removed_piece = self._board[square]
+        if removed_piece != EMPTY_SQUARE:
+            self._occupancy ^= square_bit
+            self._side_occupancy[PIECE_COLOR[removed_piece]] ^= square_bit
+            self._piece_bitboards[removed_piece] ^= square_bit
+
+        if piece != EMPTY_SQUARE:
+            self._occupancy ^= square_bit
+            self._side_occupancy[PIECE_COLOR[piece]] ^= square_bit
+            self._piece_bitboards[piece] ^= square_bit
+
+        self._board[square] = piece
 
     def _check_if_valid_player(self, piece: int) -> bool:
         """Checks if the square being moved from does not contain the current player's piece
@@ -225,12 +372,7 @@ class AtomicChessGame:
         Returns:
             bool: True if the piece belongs to the current player, False otherwise
         """
-
-        if self._current_player == PLAYER_BLACK and piece > BLACK_PIECE_THRESHOLD:
-            return False
-        if self._current_player == PLAYER_WHITE and piece < WHITE_PIECE_MIN:
-            return False
-        return True
+        return 0 <= piece <= WP and PIECE_COLOR[piece] == self._side
 
     def _check_if_valid_atomic_move(
         self, piece: int, destination_column: int, destination_row: int
@@ -244,285 +386,139 @@ class AtomicChessGame:
             bool: True if the move is valid according to atomic chess rules, False otherwise
         """
 
+        destination_square = destination_row * BOARD_SIZE + destination_column
+        is_capture = self._board[destination_square] != EMPTY_SQUARE
+
         # king not allowed to make captures
-        if (
-            piece in (BLACK_KING_VALUE, WHITE_KING_VALUE)
-            and self._board[destination_row][destination_column] != EMPTY_SQUARE
-        ):
+        if is_capture and (1 << piece) & KINGS_MASK:
             return False
 
         # player cannot blow up both kings at once
-        if self._board[destination_row][destination_column] != EMPTY_SQUARE:
-            pieces_list = []
-            positions = [
-                (0, 0),
-                (1, 0),
-                (-1, 0),
-                (0, 1),
-                (0, -1),
-                (1, 1),
-                (1, -1),
-                (-1, 1),
-                (-1, -1),
-            ]
-            for row, column in positions:
-                try:
-                    pieces_list.append(
-                        self._board[destination_row + row][destination_column + column]
-                    )
-                except IndexError:  # explosion on board edge
-                    continue
-            if BLACK_KING_VALUE in pieces_list and WHITE_KING_VALUE in pieces_list:
-                return False
-
-        return True
-
-    def _check_horizontal_vertical_move(
-        self,
-        current_column: int,
-        current_row: int,
-        destination_column: int,
-        destination_row: int,
-    ) -> bool:
-        """
-        Checks if there are any pieces in the way of a potential horizontal or vertical move.
-        Parameters:
-            current_column (int): The column of the current piece location (0-indexed)
-            current_row (int): The row of the current piece location (0-indexed)
-            destination_column (int): The column of the potential new piece location (0-indexed)
-            destination_row (int): The row of the potential new piece location (0-indexed)
-        Returns:
-            bool: True if the path is clear (no obstructions), False if there is at least one piece in the way
-        """
-
+        explosion = EXPLOSION_MASKS[destination_square]
         if (
-            current_row == destination_row and current_column < destination_column
-        ):  # horizontal, to right
-            checked_column = current_column + 1
-            while checked_column != destination_column:
-                if self._board[current_row][checked_column] != EMPTY_SQUARE:
-                    return False
-                checked_column += 1
-
-        elif (
-            current_row == destination_row and current_column > destination_column
-        ):  # horizontal, to left
-            checked_column = current_column - 1
-            while checked_column != destination_column:
-                if self._board[current_row][checked_column] != EMPTY_SQUARE:
-                    return False
-                checked_column -= 1
-
-        elif (
-            current_column == destination_column and current_row > destination_row
-        ):  # vertical, to top
-            checked_row = current_row - 1
-            while checked_row != destination_row:
-                if self._board[checked_row][current_column] != EMPTY_SQUARE:
-                    return False
-                checked_row -= 1
-
-        elif (
-            current_column == destination_column and current_row < destination_row
-        ):  # vertical, to bottom
-            checked_row = current_row + 1
-            while checked_row != destination_row:
-                if self._board[checked_row][current_column] != EMPTY_SQUARE:
-                    return False
-                checked_row += 1
+            is_capture
+            and explosion & self._piece_bitboards[BLACK_KING_VALUE]
+            and explosion & self._piece_bitboards[WHITE_KING_VALUE]
+        ):
+            return False
 
         return True
 
-    def _check_diagonal_move(
-        self,
-        current_column: int,
-        current_row: int,
-        destination_column: int,
-        destination_row: int,
-    ) -> bool:
+    def _is_path_clear(self, current_square: int, destination_square: int) -> bool:
         """
-        Checks if there are any pieces in the way of a potential diagonal move.
-        Handles all four diagonal directions.
+        Checks if there are any pieces in the way of a potential horizontal,
+        vertical, or diagonal move.
         Parameters:
-            current_column (int): column of current piece location (0-7)
-            current_row (int): row of current piece location (0-7)
-            destination_column (int): column of potential new piece location (0-7)
-            destination_row (int): row of potential new piece location (0-7)
+            current_square (int): flat board index of current piece location (0-63)
+            destination_square (int): flat board index of potential new piece location (0-63)
         Returns:
             bool: True if path is clear, False if obstructed
         """
+        return not BETWEEN[current_square][destination_square] & self._occupancy
 
-        if (
-            current_row > destination_row and current_column < destination_column
-        ):  # bottom to top, to right
-            checked_row = current_row - 1
-            checked_column = current_column + 1
-            while checked_row != destination_row:
-                if self._board[checked_row][checked_column] != EMPTY_SQUARE:
-                    return False
-                checked_row -= 1
-                checked_column += 1
-
-        elif (
-            current_row > destination_row and current_column > destination_column
-        ):  # bottom to top, to left
-            checked_row = current_row - 1
-            checked_column = current_column - 1
-            while checked_row != destination_row:
-                if self._board[checked_row][checked_column] != EMPTY_SQUARE:
-                    return False
-                checked_row -= 1
-                checked_column -= 1
-
-        elif (
-            current_row < destination_row and current_column < destination_column
-        ):  # top to bottom, to right
-            checked_row = current_row + 1
-            checked_column = current_column + 1
-            while checked_row != destination_row:
-                if self._board[checked_row][checked_column] != EMPTY_SQUARE:
-                    return False
-                checked_row += 1
-                checked_column += 1
-
-        elif (
-            current_row < destination_row and current_column > destination_column
-        ):  # top to bottom, to left
-            checked_row = current_row + 1
-            checked_column = current_column - 1
-            while checked_row != destination_row:
-                if self._board[checked_row][checked_column] != EMPTY_SQUARE:
-                    return False
-                checked_row += 1
-                checked_column -= 1
-
-        return True
-
-    def _validate_standard_move(
-        self,
-        piece: int,
-        current_column: int,
-        current_row: int,
-        destination_column: int,
-        destination_row: int,
+    def _is_target_not_own_piece(
+        self, destination_column: int, destination_row: int
     ) -> bool:
-        """Validates basic move rules common to all pieces
+        """Checks that the destination does not hold one of the current player's
+        pieces. Coordinates are assumed to be on the board; validate_move
+        enforces this.
         Parameters:
-            piece (int): The piece being moved
-            current_column (int): Starting column (0-7)
-            current_row (int): Starting row (0-7)
             destination_column (int): Target column (0-7)
             destination_row (int): Target row (0-7)
         Returns:
-            bool: True if move passes basic validation, False otherwise
+            bool: True if the destination is empty or holds an opponent's piece
         """
-        # check board bounds
-        if (
-            destination_column < 0
-            or destination_column >= BOARD_SIZE
-            or destination_row < 0
-            or destination_row >= BOARD_SIZE
-        ):
-            return False
-
         # player cannot capture their own piece
-        target_piece = self._board[destination_row][destination_column]
-        if (
-            piece < WHITE_PIECE_MIN and EMPTY_SQUARE < target_piece < WHITE_PIECE_MIN
-        ):  # black piece capturing black
-            return False
-        if (
-            piece >= WHITE_PIECE_MIN and target_piece >= WHITE_PIECE_MIN
-        ):  # white piece capturing white
-            return False
-
-        return True
+        own_occupancy = self._side_occupancy[self._side]
+        destination_square = destination_row * BOARD_SIZE + destination_column
+        return not own_occupancy >> destination_square & 1
 
     def _is_valid_rook_move(
         self,
+        piece: int,
         current_column: int,
         current_row: int,
         destination_column: int,
         destination_row: int,
     ) -> bool:
         """Check if a rook move is valid (horizontal or vertical with clear path)"""
+        current_square = current_row * BOARD_SIZE + current_column
+        destination_square = destination_row * BOARD_SIZE + destination_column
+
         # rook moves horizontally or vertically
-        if current_row != destination_row and current_column != destination_column:
+        if not ROOK_LINES[current_square] >> destination_square & 1:
             return False
 
         # check if path is clear
-        return self._check_horizontal_vertical_move(
-            current_column, current_row, destination_column, destination_row
-        )
+        return self._is_path_clear(current_square, destination_square)
 
     def _is_valid_bishop_move(
         self,
+        piece: int,
         current_column: int,
         current_row: int,
         destination_column: int,
         destination_row: int,
     ) -> bool:
         """Check if a bishop move is valid (diagonal with clear path)"""
-        row_distance = abs(destination_row - current_row)
-        column_distance = abs(destination_column - current_column)
+        current_square = current_row * BOARD_SIZE + current_column
+        destination_square = destination_row * BOARD_SIZE + destination_column
 
         # bishop moves diagonally
-        if row_distance != column_distance:
+        if not BISHOP_LINES[current_square] >> destination_square & 1:
             return False
 
         # check if path is clear
-        return self._check_diagonal_move(
-            current_column, current_row, destination_column, destination_row
-        )
+        return self._is_path_clear(current_square, destination_square)
 
     def _is_valid_queen_move(
         self,
+        piece: int,
         current_column: int,
         current_row: int,
         destination_column: int,
         destination_row: int,
     ) -> bool:
         """Check if a queen move is valid (combines rook and bishop moves)"""
+        current_square = current_row * BOARD_SIZE + current_column
+        destination_square = destination_row * BOARD_SIZE + destination_column
+
         # queen moves like rook or bishop
-        return self._is_valid_rook_move(
-            current_column, current_row, destination_column, destination_row
-        ) or self._is_valid_bishop_move(
-            current_column, current_row, destination_column, destination_row
-        )
+        if not QUEEN_LINES[current_square] >> destination_square & 1:
+            return False
+
+        # check if path is clear
+        return self._is_path_clear(current_square, destination_square)
 
     def _is_valid_king_move(
         self,
+        piece: int,
         current_column: int,
         current_row: int,
         destination_column: int,
         destination_row: int,
     ) -> bool:
         """Check if a king move is valid (one square in any direction)"""
-        row_distance = abs(destination_row - current_row)
-        column_distance = abs(destination_column - current_column)
+        current_square = current_row * BOARD_SIZE + current_column
+        destination_square = destination_row * BOARD_SIZE + destination_column
 
         # king moves exactly one square in any direction
-        return (
-            row_distance <= 1
-            and column_distance <= 1
-            and (row_distance + column_distance) > 0
-        )
+        return bool(KING_MOVES[current_square] >> destination_square & 1)
 
     def _is_valid_knight_move(
         self,
+        piece: int,
         current_column: int,
         current_row: int,
         destination_column: int,
         destination_row: int,
     ) -> bool:
         """Check if a knight move is valid (L-shaped: 2+1 or 1+2)"""
-        row_distance = abs(destination_row - current_row)
-        column_distance = abs(destination_column - current_column)
+        current_square = current_row * BOARD_SIZE + current_column
+        destination_square = destination_row * BOARD_SIZE + destination_column
 
         # knight moves in L-shape: 2 squares one direction, 1 square perpendicular
-        return (row_distance == 2 and column_distance == 1) or (
-            row_distance == 1 and column_distance == 2
-        )
+        return bool(KNIGHT_MOVES[current_square] >> destination_square & 1)
 
     def _is_valid_pawn_move(
         self,
@@ -533,48 +529,42 @@ class AtomicChessGame:
         destination_row: int,
     ) -> bool:
         """Check if a pawn move is valid (forward movement, diagonal capture)"""
-        row_distance = abs(destination_row - current_row)
-        column_distance = abs(destination_column - current_column)
-        target_piece = self._board[destination_row][destination_column]
-
-        # pawns move forward only
-        if piece == BP and current_row >= destination_row:  # black pawn moving up
-            return False
-        if piece == WP and current_row <= destination_row:  # white pawn moving down
+        row_step = destination_row - current_row
+        column_step = destination_column - current_column
+        target_piece = self._board[destination_row * BOARD_SIZE + destination_column]
+        # pawns move forward only: down the board for black, up for white
+        direction = PAWN_DIRECTION[piece]
+
+        # diagonal moves (captures): exactly 1 row forward, onto a piece
+        if column_step * column_step == 1:
+            return row_step == direction and target_piece != EMPTY_SQUARE
+
+        # straight moves (non-captures) cannot capture pieces directly ahead
+        if column_step != 0 or target_piece != EMPTY_SQUARE:
             return False
 
-        # diagonal moves (captures)
-        if column_distance == 1:
-            # can only move diagonally if capturing
-            if target_piece == EMPTY_SQUARE:
-                return False
-            # must move exactly 1 row forward
-            return row_distance == 1
-
-        # straight moves (non-captures)
-        if current_column == destination_column:
-            # cannot capture pieces directly ahead
-            if target_piece != EMPTY_SQUARE:
-                return False
-
-            # can move 1 or 2 squares from starting position
-            if (
-                piece == BP
-                and current_row == BLACK_PAWN_START_ROW
-                and row_distance <= 2
-            ):
-                return True
-            if (
-                piece == WP
-                and current_row == WHITE_PAWN_START_ROW
-                and row_distance <= 2
-            ):
-                return True
-
-            # otherwise can only move 1 square
-            return row_distance == 1
-
-        return False
+        # can move 1 square, or 2 from the starting position as long as the
+        # square passed over is empty
+        if row_step == direction:
+            return True
+        return (
+            row_step == 2 * direction
+            and current_row == PAWN_START_ROW[piece]
+            and self._is_path_clear(
+                current_row * BOARD_SIZE + current_column,
+                destination_row * BOARD_SIZE + destination_column,
+            )
+        )
+
+    # movement validators indexed by piece value, None for non-piece values
+    _MOVE_VALIDATORS = [None] * (WP + 1)
+    _MOVE_VALIDATORS[BR] = _MOVE_VALIDATORS[WR] = _is_valid_rook_move
+    _MOVE_VALIDATORS[BH] = _MOVE_VALIDATORS[WH] = _is_valid_knight_move
+    _MOVE_VALIDATORS[BB] = _MOVE_VALIDATORS[WB] = _is_valid_bishop_move
+    _MOVE_VALIDATORS[BQ] = _MOVE_VALIDATORS[WQ] = _is_valid_queen_move
+    _MOVE_VALIDATORS[BK] = _MOVE_VALIDATORS[WK] = _is_valid_king_move
+    _MOVE_VALIDATORS[BP] = _MOVE_VALIDATORS[WP] = _is_valid_pawn_move
+    _MOVE_VALIDATORS = tuple(_MOVE_VALIDATORS)
 
     def is_valid_position(self, row: int, column: int) -> bool:
         """Check if coordinates are within board boundaries.
@@ -590,32 +580,25 @@ class AtomicChessGame:
         self, explosion_row: int, explosion_column: int
     ) -> None:
         """
-        Executes an atomic explosion at the given coordinates, destroying all
-        non-pawn pieces in the 8 surrounding squares.
+        Executes an atomic explosion at the given coordinates, destroying the
+        piece on that square and all non-pawn pieces in the 8 surrounding squares.
         Parameters:
             explosion_row (int): Row where explosion occurs
             explosion_column (int): Column where explosion occurs
         """
-        # Define all 8 surrounding positions plus the explosion center
-        explosion_positions = [
-            (explosion_row - 1, explosion_column - 1),  # top-left
-            (explosion_row - 1, explosion_column),  # top
-            (explosion_row - 1, explosion_column + 1),  # top-right
-            (explosion_row, explosion_column - 1),  # left
-            (explosion_row, explosion_column),  # center
-            (explosion_row, explosion_column + 1),  # right
-            (explosion_row + 1, explosion_column - 1),  # bottom-left
-            (explosion_row + 1, explosion_column),  # bottom
-            (explosion_row + 1, explosion_column + 1),  # bottom-right
-        ]
-
-        for row, column in explosion_positions:
-            # Check if position is within board bounds
-            if self.is_valid_position(row, column):
-                piece = self._board[row][column]
-                # Destroy all pieces except pawns
-                if piece not in (BP, WP, EMPTY_SQUARE):
-                    self._board[row][column] = EMPTY_SQUARE
+        explosion_square = explosion_row * BOARD_SIZE + explosion_column
+        # the captured piece is destroyed even if it is a pawn
+        self._set_square(explosion_square, EMPTY_SQUARE)
+
+        # Destroy all surrounding pieces except pawns, lowest square first
+        pawns = self._piece_bitboards[BP] | self._piece_bitboards[WP]
+        destroyed = EXPLOSION_MASKS[explosion_square] & self._occupancy & ~pawns
+        while destroyed:
+            square_bit = destroyed & -destroyed
+            destroyed ^= square_bit
+            square = square_bit.bit_length() - 1
+            self._set_square(square, EMPTY_SQUARE)
+            self._changed_squares.append(divmod(square, BOARD_SIZE))
 
     def validate_move(
         self,
@@ -636,12 +619,38 @@ class AtomicChessGame:
         Returns:
             bool: True if the move is valid, False otherwise
         """
-        # check basic move validation
-        if not self._validate_standard_move(
-            piece, current_column, current_row, destination_column, destination_row
+        # check board bounds once, so the rule checks can index tables freely
+        if not (
+            0 <= current_row < BOARD_SIZE
+            and 0 <= current_column < BOARD_SIZE
+            and 0 <= destination_row < BOARD_SIZE
+            and 0 <= destination_column < BOARD_SIZE
         ):
             return False
 
+        return self._check_move_rules(
+            piece, current_row, current_column, destination_row, destination_column
+        )
+
+    def _check_move_rules(
+        self,
+        piece: int,
+        current_row: int,
+        current_column: int,
+        destination_row: int,
+        destination_column: int,
+    ) -> bool:
+        """Runs every chess and atomic chess rule check for a move.
+        Coordinates are assumed to be on the board; validate_move enforces this.
+        Parameters:
+            piece (int): The piece being moved
+            current_row (int): Starting row (0-7)
+            current_column (int): Starting column (0-7)
+            destination_row (int): Target row (0-7)
+            destination_column (int): Target column (0-7)
+        Returns:
+            bool: True if the move is valid, False otherwise
+        """
         # check if there's actually a piece to move
         if piece == EMPTY_SQUARE:
             return False
@@ -650,6 +659,10 @@ class AtomicChessGame:
         if not self._check_if_valid_player(piece):
             return False
 
+        # check the destination is not one of the player's own pieces
+        if not self._is_target_not_own_piece(destination_column, destination_row):
+            return False
+
         # check atomic chess specific rules
         if not self._check_if_valid_atomic_move(
             piece, destination_column, destination_row
@@ -657,32 +670,17 @@ class AtomicChessGame:
             return False
 
         # validate piece-specific movement rules
-        if piece in (BR, WR):  # rook
-            return self._is_valid_rook_move(
-                current_column, current_row, destination_column, destination_row
-            )
-        elif piece in (BB, WB):  # bishop
-            return self._is_valid_bishop_move(
-                current_column, current_row, destination_column, destination_row
-            )
-        elif piece in (BQ, WQ):  # queen
-            return self._is_valid_queen_move(
-                current_column, current_row, destination_column, destination_row
-            )
-        elif piece in (BK, WK):  # king
-            return self._is_valid_king_move(
-                current_column, current_row, destination_column, destination_row
-            )
-        elif piece in (BH, WH):  # knight
-            return self._is_valid_knight_move(
-                current_column, current_row, destination_column, destination_row
-            )
-        elif piece in (BP, WP):  # pawn
-            return self._is_valid_pawn_move(
-                piece, current_column, current_row, destination_column, destination_row
-            )
-
-        return False
+        is_valid_move = self._MOVE_VALIDATORS[piece]
+        if is_valid_move is None:
+            return False
+        return is_valid_move(
+            self,
+            piece,
+            current_column,
+            current_row,
+            destination_column,
+            destination_row,
+        )
 
     def parse_square_notation(self, square: str) -> tuple[int, int]:
         """
@@ -691,31 +689,22 @@ class AtomicChessGame:
             square (str): Square in algebraic notation (e.g., "a1", "h8")
         Returns:
             tuple[int, int]: (row, column) coordinates (0-indexed)
+        Raises:
+            KeyError: if square does not name a square on the board
         """
-        column = ord(square[0].lower()) - ord("a")
-        row = BOARD_SIZE - int(square[1])  # convert to 0-indexed from bottom
-        return row, column
+        return SQUARE_TABLE[square]
 
     def check_if_king_dead(self) -> None:
         """
         Checks if either king has been eliminated and updates game state accordingly.
         """
-        black_king_alive = False
-        white_king_alive = False
-
-        # scan the board for kings
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                piece = self._board[row][col]
-                if piece == BLACK_KING_VALUE:
-                    black_king_alive = True
-                elif piece == WHITE_KING_VALUE:
-                    white_king_alive = True
+        black_king_alive = self._piece_bitboards[BLACK_KING_VALUE] != 0
+        white_king_alive = self._piece_bitboards[WHITE_KING_VALUE] != 0
 
         # update game state based on which kings are alive
         if not black_king_alive and not white_king_alive:
             # Both kings dead - current player loses
-            if self._current_player == PLAYER_WHITE:
+            if self._side == WHITE_SIDE:
                 self._game_state = GAME_BLACK_WON
             else:
                 self._game_state = GAME_WHITE_WON
@@ -728,7 +717,4 @@ class AtomicChessGame:
         """
         Switches the current player between WHITE and BLACK.
         """
-        if self._current_player == PLAYER_WHITE:
-            self._current_player = PLAYER_BLACK
-        else:
-            self._current_player = PLAYER_WHITE
+        self._side ^= 1
@@ -1,16 +1,47 @@
 #!/usr/bin/env python3
 """
 Development runner with hot reload for the chess GUI.
-Automatically restarts the GUI when source files are modified.
+Automatically reloads the GUI when source files are modified: by default the
+changed modules are reloaded with importlib inside this process, and with
+--restart the GUI is restarted as a new process instead.
+Uses watchdog to get file change events when it is installed, and falls back
+to polling modification times otherwise.
 """
 
+import importlib
 import os
 import sys
 import time
 import subprocess
 import threading
+import traceback
 from pathlib import Path
 
+try:
+    from watchdog.events import PatternMatchingEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional, poll instead
+    Observer = None
+else:
+
+    class ChangeHandler(PatternMatchingEventHandler):
+        """Sets an event when a watched file is written.
+        Only writes count: the GUI process opening its own source files must
+        not look like a change."""
+
+        def __init__(self, changed, **kwargs):
+            super().__init__(**kwargs)
+            self.changed = changed
+
+        def on_modified(self, event):
+            self.changed.set()
+
+        def on_created(self, event):
+            self.changed.set()
+
+        def on_moved(self, event):
+            self.changed.set()
+
 
 class HotReloader:
     def __init__(self, script_path, watch_files=None):
@@ -19,11 +50,20 @@ class HotReloader:
         self.process = None
         self.last_modified = {}
         self.running = True
+        self.observer = None
+        self.changed = threading.Event()
+        self.reload_requested = False
 
         # Add the main script to watch list
         if script_path not in self.watch_files:
             self.watch_files.append(script_path)
 
+        # Group watched files by directory: {directory: {file name: path}}
+        self.watch_dirs = {}
+        for filepath in self.watch_files:
+            directory, name = os.path.split(filepath)
+            self.watch_dirs.setdefault(directory or os.curdir, {})[name] = filepath
+
     def get_file_modified_time(self, filepath):
         """Get the last modified time of a file."""
         try:
@@ -32,15 +72,61 @@ class HotReloader:
             return 0
 
     def check_for_changes(self):
-        """Check if any watched files have been modified."""
-        for filepath in self.watch_files:
-            current_time = self.get_file_modified_time(filepath)
-            last_time = self.last_modified.get(filepath, 0)
+        """Check if any watched files have been modified, reading each watched
+        directory once instead of querying every file separately."""
+        changed = False
+        for directory, files in self.watch_dirs.items():
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        filepath = files.get(entry.name)
+                        if filepath is None:
+                            continue
+                        current_time = entry.stat().st_mtime
+                        last_time = self.last_modified.get(filepath, 0)
+
+                        if current_time > last_time:
+                            self.last_modified[filepath] = current_time
+                            changed = True
+            except OSError:
+                continue
+        return changed
+
+    def start_watching(self):
+        """Watch the files with watchdog, if available. Returns True if watching."""
+        if Observer is None:
+            return False
+
+        paths = [Path(filepath).resolve() for filepath in self.watch_files]
+        handler = ChangeHandler(
+            self.changed,
+            patterns=[str(path) for path in paths],
+            ignore_directories=True,
+        )
 
-            if current_time > last_time:
-                self.last_modified[filepath] = current_time
-                return True
-        return False
+        self.observer = Observer()
+        for directory in {path.parent for path in paths}:
+            self.observer.schedule(handler, str(directory))
+        self.observer.start()
+        return True
+
+    def stop_watching(self):
+        """Stop the watchdog observer, if one is running."""
+        if self.observer:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+
+    def wait_for_changes(self, timeout):
+        """Wait up to timeout seconds and report if any watched file changed."""
+        if self.observer:
+            changed = self.changed.wait(timeout)
+            # clear only after a successful wait so a late event is not lost
+            if changed:
+                self.changed.clear()
+            return changed
+        time.sleep(timeout)
+        return self.check_for_changes()
 
     def start_process(self):
         """Start the GUI process."""
@@ -62,24 +148,77 @@ class HotReloader:
                 self.process.kill()
             self.process = None
 
-    def run(self):
-        """Run the hot reloader."""
+    def start_monitoring(self):
+        """Print the banner and start watching the files for changes."""
         print("Hot Reload Development Server")
         print(f"Watching: {', '.join(self.watch_files)}")
         print("-" * 50)
 
-        # Initialize file modification times
-        for filepath in self.watch_files:
-            self.last_modified[filepath] = self.get_file_modified_time(filepath)
+        # Prefer file events, else initialize modification times for polling
+        if self.start_watching():
+            print("Watching for file events")
+        else:
+            for filepath in self.watch_files:
+                self.last_modified[filepath] = self.get_file_modified_time(filepath)
+
+    def reload_modules(self):
+        """Reload the watched modules, the script's own module last."""
+        script_module = Path(self.script_path).stem
+        module_names = [Path(filepath).stem for filepath in self.watch_files]
+        module_names.sort(key=lambda name: name == script_module)
+        for name in module_names:
+            importlib.reload(importlib.import_module(name))
+
+    def poll_in_process(self, gui):
+        """Tk callback: reload the modules and close the GUI if files changed."""
+        if self.wait_for_changes(0):
+            print("Changes detected! Reloading...")
+            try:
+                self.reload_modules()
+            except Exception:
+                # keep the running GUI until the code loads again
+                traceback.print_exc()
+                print("Reload failed, keeping the current GUI")
+            else:
+                self.reload_requested = True
+                gui.root.destroy()
+                return
+        gui.root.after(500, self.poll_in_process, gui)  # Check every 500ms
+
+    def run_in_process(self, gui_class_name="ChessGUI"):
+        """Run the GUI in this process, rebuilding it from reloaded modules
+        whenever a watched file changes, which avoids interpreter startup."""
+        self.start_monitoring()
+        module = importlib.import_module(Path(self.script_path).stem)
+
+        try:
+            while self.running:
+                gui = getattr(module, gui_class_name)()
+                self.reload_requested = False
+                gui.root.after(500, self.poll_in_process, gui)
+                gui.run()
+
+                if not self.reload_requested:
+                    print("GUI closed")
+                    break
+
+        except KeyboardInterrupt:
+            print("\nShutting down...")
+        finally:
+            self.running = False
+            self.stop_watching()
+
+    def run(self):
+        """Run the hot reloader, restarting the GUI process on changes."""
+        self.start_monitoring()
 
         # Start the initial process
         self.start_process()
 
         try:
             while self.running:
-                time.sleep(0.5)  # Check every 500ms
-
-                if self.check_for_changes():
+                # Check every 500ms; file events end the wait early
+                if self.wait_for_changes(0.5):
                     print("Changes detected! Restarting...")
                     self.start_process()
 
@@ -92,12 +231,13 @@ class HotReloader:
             print("\nShutting down...")
         finally:
             self.running = False
+            self.stop_watching()
             self.stop_process()
 
 
 def main():
     # Files to watch for changes
-    watch_files = ["chess_gui.py", "ChessVar.py"]
+    watch_files = ["chess_gui.py", "chess_logic.py"]
 
     # Check if files exist
     missing_files = [f for f in watch_files if not os.path.exists(f)]
@@ -106,7 +246,10 @@ def main():
         return
 
     reloader = HotReloader("chess_gui.py", watch_files)
-    reloader.run()
+    if "--restart" in sys.argv[1:]:
+        reloader.run()
+    else:
+        reloader.run_in_process()
 
 
 if __name__ == "__main__":